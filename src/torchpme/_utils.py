@@ -18,6 +18,13 @@ def _get_device(device: Union[None, str, torch.device]) -> torch.device:
     return new_device
 
 
+def _is_compiling() -> bool:
+    # `torch.compiler` is not available in TorchScript, where the branch is discarded
+    if torch.jit.is_scripting():
+        return False
+    return torch.compiler.is_compiling()
+
+
 def _validate_parameters(
     charges: torch.Tensor,
     cell: torch.Tensor,
@@ -28,6 +35,8 @@ def _validate_parameters(
     dtype: torch.dtype,
     device: torch.device,
 ) -> None:
+    # NB: this runs on every forward pass; keep the checks on plain integers, dtypes
+    # and devices and only build error messages once a check has failed.
     if positions.dtype != dtype:
         raise TypeError(
             f"type of `positions` ({positions.dtype}) must be same as the class "
@@ -41,21 +50,21 @@ def _validate_parameters(
         )
 
     # check shape, dtype and device of positions
-    num_atoms = len(positions)
-    if list(positions.shape) != [len(positions), 3]:
+    if positions.dim() != 2 or positions.shape[1] != 3:
         raise ValueError(
             "`positions` must be a tensor with shape [n_atoms, 3], got tensor "
             f"with shape {list(positions.shape)}"
         )
+    num_atoms = positions.shape[0]
 
     # check shape, dtype and device of cell
-    if list(cell.shape) != [3, 3]:
+    if cell.dim() != 2 or cell.shape[0] != 3 or cell.shape[1] != 3:
         raise ValueError(
             "`cell` must be a tensor with shape [3, 3], got tensor with shape "
             f"{list(cell.shape)}"
         )
 
-    if cell.dtype != positions.dtype:
+    if cell.dtype != dtype:
         raise TypeError(
             f"type of `cell` ({cell.dtype}) must be same as the class ({dtype})"
         )
@@ -65,9 +74,8 @@ def _validate_parameters(
             f"device of `cell` ({cell.device}) must be same as the class ({device})"
         )
 
-    if smearing is not None and torch.equal(
-        cell.det(), torch.tensor(0.0, dtype=cell.dtype, device=cell.device)
-    ):
+    # compare on the host, rather than against a freshly allocated zero tensor
+    if smearing is not None and cell.det().item() == 0.0:
         raise ValueError(
             "provided `cell` has a determinant of 0 and therefore is not valid for "
             "periodic calculation"
@@ -81,15 +89,15 @@ def _validate_parameters(
             f"{list(charges.shape)}"
         )
 
-    if list(charges.shape) != [num_atoms, charges.shape[1]]:
+    if charges.shape[0] != num_atoms:
         raise ValueError(
             "`charges` must be a tensor with shape [n_atoms, n_channels], with "
             "`n_atoms` being the same as the variable `positions`. Got tensor with "
             f"shape {list(charges.shape)} where positions contains "
-            f"{len(positions)} atoms"
+            f"{num_atoms} atoms"
         )
 
-    if charges.dtype != positions.dtype:
+    if charges.dtype != dtype:
         raise TypeError(
             f"type of `charges` ({charges.dtype}) must be same as the class ({dtype})"
         )
@@ -101,12 +109,13 @@ def _validate_parameters(
         )
 
     # check shape, dtype & device of `neighbor_indices` and `neighbor_distances`
-    if neighbor_indices.shape[1] != 2:
+    if neighbor_indices.dim() != 2 or neighbor_indices.shape[1] != 2:
         raise ValueError(
             "neighbor_indices is expected to have shape [num_neighbors, 2]"
             f", but got {list(neighbor_indices.shape)} for one "
             "structure"
         )
+    num_neighbors = neighbor_indices.shape[0]
 
     if neighbor_indices.device != device:
         raise ValueError(
@@ -114,7 +123,7 @@ def _validate_parameters(
             f"same as the class ({device})"
         )
 
-    if neighbor_distances.shape != neighbor_indices[:, 0].shape:
+    if neighbor_distances.dim() != 1 or neighbor_distances.shape[0] != num_neighbors:
         raise ValueError(
             "`neighbor_indices` and `neighbor_distances` need to have shapes "
             "[num_neighbors, 2] and [num_neighbors], but got "
@@ -127,7 +136,7 @@ def _validate_parameters(
             f"same as the class ({device})"
         )
 
-    if neighbor_distances.dtype != positions.dtype:
+    if neighbor_distances.dtype != dtype:
         raise TypeError(
             f"type of `neighbor_distances` ({neighbor_distances.dtype}) must be same "
             f"as the class ({dtype})"
@@ -3,7 +3,7 @@ from typing import Optional, Union
 import torch
 from torch import profiler
 
-from .._utils import _get_device, _get_dtype, _validate_parameters
+from .._utils import _get_device, _get_dtype, _is_compiling, _validate_parameters
 from ..potentials import Potential
 
 
@@ -20,6 +20,12 @@ class Calculator(torch.nn.Module):
     NB: typically a subclass should only provide an implementation of
     :func:`Calculator._compute_kspace`.
 
+    The inputs of :func:`Calculator.forward` are checked for consistent shapes, types
+    and devices on every call. Once a workflow is known to provide valid inputs, these
+    checks can be skipped by setting ``calculator.validate_parameters = False``. They
+    are also skipped automatically while the calculator is compiled with
+    :func:`torch.compile`.
+
     :param potential: a :class:`Potential` class object containing the functions
         that are necessary to compute the various components of the potential, as
         well as the parameters that determine the behavior of the potential itself.
@@ -65,6 +71,7 @@ class Calculator(torch.nn.Module):
         self.full_neighbor_list = full_neighbor_list
 
         self.prefactor = prefactor
+        self.validate_parameters: bool = True
 
     def _compute_rspace(
         self,
@@ -82,11 +89,14 @@ class Calculator(torch.nn.Module):
 
         # Multiply the bare potential terms V(r_ij) with the corresponding charges
         # of ``atom j'' to obtain q_j*V(r_ij). Since each atom j can be a neighbor of
-        # multiple atom i's, we need to access those from neighbor_indices
+        # multiple atom i's, we need to access those from neighbor_indices. The pair
+        # potential does not depend on the charges, so it is evaluated once above and
+        # broadcast over all charge channels here.
         atom_is = neighbor_indices[:, 0]
         atom_js = neighbor_indices[:, 1]
+        potentials_bare = potentials_bare.unsqueeze(-1)
         with profiler.record_function("compute real potential"):
-            contributions_is = charges[atom_js] * potentials_bare.unsqueeze(-1)
+            contributions_is = charges[atom_js] * potentials_bare
 
         # For each atom i, add up all contributions of the form q_j*V(r_ij) for j
         # ranging over all of its neighbors.
@@ -96,7 +106,7 @@ class Calculator(torch.nn.Module):
             # If we are using a half neighbor list, we need to add the contributions
             # from the "inverse" pairs (j, i) to the atoms i
             if not self.full_neighbor_list:
-                contributions_js = charges[atom_is] * potentials_bare.unsqueeze(-1)
+                contributions_js = charges[atom_is] * potentials_bare
                 potential.index_add_(0, atom_js, contributions_js)
 
         # Compensate for double counting of pairs (i,j) and (j,i)
@@ -157,16 +167,17 @@ class Calculator(torch.nn.Module):
         :param neighbor_distances: torch.tensor with the pair distances of the neighbors
             for which the potential should be computed in real space.
         """
-        _validate_parameters(
-            charges=charges,
-            cell=cell,
-            positions=positions,
-            neighbor_indices=neighbor_indices,
-            neighbor_distances=neighbor_distances,
-            smearing=self.potential.smearing,
-            dtype=self.dtype,
-            device=self.device,
-        )
+        if self.validate_parameters and not _is_compiling():
+            _validate_parameters(
+                charges=charges,
+                cell=cell,
+                positions=positions,
+                neighbor_indices=neighbor_indices,
+                neighbor_distances=neighbor_distances,
+                smearing=self.potential.smearing,
+                dtype=self.dtype,
+                device=self.device,
+            )
 
         # Compute short-range (SR) part using a real space sum
         potential_sr = self._compute_rspace(
@@ -213,7 +213,9 @@ class KSpaceFilter(torch.nn.Module):
 
         if cell is not None or ns_mesh is not None:
             self._kvectors = generate_kvectors_for_mesh(ns=self.ns_mesh, cell=self.cell)
-            self._k_sq = torch.linalg.norm(self._kvectors, dim=3) ** 2
+            # summing the squares directly avoids a square root and a power pass
+            # over the whole k-space grid
+            self._k_sq = torch.sum(self._kvectors**2, dim=3)
 
 
 class P3MKSpaceFilter(KSpaceFilter):
@@ -306,11 +308,12 @@ class P3MKSpaceFilter(KSpaceFilter):
         U2 = self._charge_assignment(kh)
         if self.mode == 0:
             # special (much simpler) case for point-charge potentials
-            masked = torch.where(U2 == 0, 1.0, U2)
-            return torch.where(U2 == 0, 0.0, torch.reciprocal(masked))
+            U2_zero = U2 == 0
+            masked = torch.where(U2_zero, 1.0, U2)
+            return torch.reciprocal(masked).masked_fill(U2_zero, 0.0)
 
         D = self._differential_operator(kh, actual_mesh_spacing)
-        D_to_4mode = torch.linalg.norm(D, dim=-1) ** (4 * self.mode)
+        D_to_4mode = torch.sum(D**2, dim=-1) ** (2 * self.mode)
 
         # Calculate (part of) the kernel See eq.30 of this paper
         # https://doi.org/10.1063/1.3000389 for your main reference, as well as the
@@ -319,8 +322,9 @@ class P3MKSpaceFilter(KSpaceFilter):
         numerator = torch.sum(kvectors * D, dim=-1) ** self.mode
         denominator = U2 * D_to_4mode
 
-        masked = torch.where(denominator == 0, 1.0, denominator)
-        return torch.where(denominator == 0, 0.0, numerator / masked)
+        denominator_zero = denominator == 0
+        masked = torch.where(denominator_zero, 1.0, denominator)
+        return (numerator / masked).masked_fill(denominator_zero, 0.0)
 
     def _differential_operator(
         self, kh: torch.Tensor, actual_mesh_spacing: torch.Tensor
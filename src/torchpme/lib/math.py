@@ -1,3 +1,5 @@
+from typing import Optional
+
 import torch
 from torch.special import gammaln
 
@@ -84,21 +86,65 @@ def gammaincc_over_powerlaw(exponent: torch.Tensor, z: torch.Tensor) -> torch.Te
     :param z: Value at which to evaluate the function
     :return: Regularized incomplete gamma function complement
     """
+    # Square roots and exponentials are shared between the terms of each
+    # expression, so that every transcendental is evaluated only once per element.
     if exponent == 1:
         return torch.exp(-z) / z
     if exponent == 2:
-        return torch.sqrt(torch.pi / z) * torch.erfc(torch.sqrt(z))
+        sqrt_z = torch.sqrt(z)
+        return torch.pi**0.5 * torch.erfc(sqrt_z) / sqrt_z
     if exponent == 3:
         return exp1(z)
     if exponent == 4:
-        return 2 * (
-            torch.exp(-z) - torch.sqrt(torch.pi * z) * torch.erfc(torch.sqrt(z))
-        )
+        sqrt_z = torch.sqrt(z)
+        return 2 * (torch.exp(-z) - torch.pi**0.5 * sqrt_z * torch.erfc(sqrt_z))
     if exponent == 5:
         return torch.exp(-z) - z * exp1(z)
     if exponent == 6:
+        sqrt_z = torch.sqrt(z)
         return (
             (2 - 4 * z) * torch.exp(-z)
-            + 4 * torch.sqrt(torch.pi * z**3) * torch.erfc(torch.sqrt(z))
+            + 4 * torch.pi**0.5 * z * sqrt_z * torch.erfc(sqrt_z)
         ) / 3
     raise ValueError(f"Unsupported exponent: {exponent}")
+
+
+def gammaincc_half_integer(
+    exponent: int, z: torch.Tensor, sqrt_z: Optional[torch.Tensor] = None
+) -> torch.Tensor:
+    r"""
+    Regularized upper incomplete gamma function :math:`Q(p/2, z)` for integer exponents.
+
+    For the integer exponents :math:`p` supported by :func:`gammaincc_over_powerlaw`,
+    the function reduces to closed-form expressions in terms of :math:`\exp(-z)` and
+    :math:`\mathrm{erfc}(\sqrt{z})`, which are considerably cheaper to evaluate than
+    the generic :func:`torch.special.gammaincc`. As all terms are positive, the
+    expressions are also free of cancellation errors.
+
+    :param exponent: Exponent :math:`p` of the power law
+    :param z: Value at which to evaluate the function
+    :param sqrt_z: Optional precomputed :math:`\sqrt{z}`, used for odd exponents. When
+        the caller has it at hand (e.g. :math:`z = r^2 / 2\sigma^2` computed from
+        distances), passing it saves a square root over the whole input.
+    :return: Regularized upper incomplete gamma function :math:`Q(p/2, z)`
+    """
+    if exponent == 2:
+        return torch.exp(-z)
+    if exponent == 4:
+        return (1 + z) * torch.exp(-z)
+    if exponent == 6:
+        return (1 + z * (1 + 0.5 * z)) * torch.exp(-z)
+
+    # half-integer orders, obtained from Q(1/2, z) = erfc(sqrt(z)) through the
+    # recurrence Q(a + 1, z) = Q(a, z) + z^a exp(-z) / Gamma(a + 1)
+    if sqrt_z is None:
+        sqrt_z = torch.sqrt(z)
+    if exponent == 1:
+        return torch.erfc(sqrt_z)
+    if exponent == 3:
+        return torch.erfc(sqrt_z) + 2 / torch.pi**0.5 * sqrt_z * torch.exp(-z)
+    if exponent == 5:
+        return torch.erfc(sqrt_z) + 2 / torch.pi**0.5 * sqrt_z * (
+            1 + 2 / 3 * z
+        ) * torch.exp(-z)
+    raise ValueError(f"Unsupported exponent: {exponent}")
@@ -92,12 +92,11 @@ class CoulombPotential(Potential):
         # avoid NaNs in backward, see
         # https://github.com/jax-ml/jax/issues/1052
         # https://github.com/tensorflow/probability/blob/main/discussion/where-nan.pdf
-        masked = torch.where(k_sq == 0, 1.0, k_sq)
-        return torch.where(
-            k_sq == 0,
-            0.0,
-            4 * torch.pi * torch.exp(-0.5 * self.smearing**2 * masked) / masked,
-        )
+        k_zero = k_sq == 0
+        masked = torch.where(k_zero, 1.0, k_sq)
+        fourier = 4 * torch.pi * torch.exp(-0.5 * self.smearing**2 * masked) / masked
+        # the quotient is not needed by autograd, so it can be masked in place
+        return fourier.masked_fill_(k_zero, 0.0)
 
     def self_contribution(self) -> torch.Tensor:
         # self-correction for 1/r potential
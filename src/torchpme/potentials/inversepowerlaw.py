@@ -1,9 +1,10 @@
+import math
 from typing import Optional, Union
 
 import torch
 from torch.special import gammainc
 
-from torchpme.lib import gamma, gammaincc_over_powerlaw
+from torchpme.lib import gammaincc_half_integer, gammaincc_over_powerlaw
 
 from .potential import Potential
 
@@ -33,6 +34,13 @@ class InversePowerLawPotential(Potential):
         :class:`Potential`.
     :param dtype: type used for the internal buffers and parameters
     :param device: device used for the internal buffers and parameters
+    :param amp_dtype: optional reduced-precision floating point type (typically
+        ``torch.bfloat16``) used to evaluate :meth:`lr_from_k_sq` on CUDA devices. The
+        result is cast back to the type of the input. On large meshes this halves the
+        memory traffic of the k-space kernel, at the cost of accuracy: with
+        ``torch.bfloat16``, errors are of the order of 1% of the largest value of the
+        kernel. On other devices, and by default, the kernel is evaluated in full
+        precision.
     """
 
     def __init__(
@@ -42,14 +50,37 @@ class InversePowerLawPotential(Potential):
         exclusion_radius: Optional[float] = None,
         dtype: Optional[torch.dtype] = None,
         device: Union[None, str, torch.device] = None,
+        amp_dtype: Optional[torch.dtype] = None,
     ):
         super().__init__(smearing, exclusion_radius, dtype, device)
 
+        if amp_dtype is not None and not amp_dtype.is_floating_point:
+            raise TypeError(
+                f"`amp_dtype` must be a floating point type, got {amp_dtype}"
+            )
+        self.amp_dtype: Optional[torch.dtype] = amp_dtype
+
         # function call to check the validity of the exponent
         gammaincc_over_powerlaw(exponent, torch.tensor(1.0, dtype=dtype, device=device))
         self.register_buffer(
             "exponent", torch.tensor(exponent, dtype=self.dtype, device=self.device)
         )
+        # exponent of the incomplete gamma functions in real space, stored to avoid
+        # creating a new scalar tensor on every call
+        self.register_buffer("_peff", self.exponent / 2, persistent=False)
+        self.register_buffer(
+            "_rsqrt2",
+            torch.rsqrt(torch.tensor(2.0, dtype=self.dtype, device=self.device)),
+            persistent=False,
+        )
+        # only integer exponents pass the check above
+        self._int_exponent = int(exponent)
+
+        # constants that only depend on the exponent, evaluated once here rather than
+        # through `gamma` (and thus a few small kernels) on every call
+        self._kpeff = (3 - self._int_exponent) / 2
+        self._kprefac = math.pi**1.5 / math.gamma(self._int_exponent / 2)
+        self._self_prefac = 1 / math.gamma(self._int_exponent / 2 + 1)
 
     @torch.jit.export
     def from_dist(self, dist: torch.Tensor) -> torch.Tensor:
@@ -59,7 +90,32 @@ class InversePowerLawPotential(Potential):
         :param dist: torch.tensor containing the distances at which the potential is to
             be evaluated.
         """
-        return torch.pow(dist, -self.exponent)
+        # Using a Python integer rather than the `exponent` buffer lets `torch.pow`
+        # dispatch to its specialized kernels (e.g. reciprocal for p=1), instead of
+        # the generic exp/log based one
+        return torch.pow(dist, -self._int_exponent)
+
+    @torch.jit.export
+    def sr_from_dist(self, dist: torch.Tensor) -> torch.Tensor:
+        if self.smearing is None:
+            raise ValueError(
+                "Cannot compute range-separated potential when `smearing` is not "
+                "specified."
+            )
+        if self.exclusion_radius is not None:
+            return -self.lr_from_dist(dist) * self.f_cutoff(dist)
+
+        # Evaluated directly as Q(p/2, x) / r^p rather than as V - V_LR: the closed
+        # form of Q is much cheaper than `gammainc`, and does not suffer from
+        # cancellation at large distances
+        # sqrt(x) = r / (sqrt(2) sigma) is obtained from the distances directly, which
+        # saves taking the square root of x for odd exponents
+        sqrt_x = dist * (self._rsqrt2 / self.smearing)
+        if self._int_exponent == 1:
+            # Coulomb: Q(1/2, x) = erfc(sqrt(x)), and x itself is not needed
+            return torch.erfc(sqrt_x) / dist
+        potential_sr = gammaincc_half_integer(self._int_exponent, sqrt_x**2, sqrt_x)
+        return potential_sr * self.from_dist(dist)
 
     @torch.jit.export
     def lr_from_dist(self, dist: torch.Tensor) -> torch.Tensor:
@@ -84,13 +140,20 @@ class InversePowerLawPotential(Potential):
                 "Cannot compute long-range contribution without specifying `smearing`."
             )
 
-        exponent = self.exponent
-        smearing = self.smearing
+        if self._int_exponent == 1:
+            # Coulomb: P(1/2, x) = erf(sqrt(x)), much cheaper than the generic gammainc
+            return torch.erf(dist * (self._rsqrt2 / self.smearing)) / dist
+
+        # prefac / x**peff = 1 / r^p, so that the bare potential can be reused
+        x = self._reduced_dist_sq(dist)
+        return gammainc(self._peff, x) * self.from_dist(dist)
 
-        x = 0.5 * dist**2 / smearing**2
-        peff = exponent / 2
-        prefac = 1.0 / (2 * smearing**2) ** peff
-        return prefac * gammainc(peff, x) / x**peff
+    def _reduced_dist_sq(self, dist: torch.Tensor) -> torch.Tensor:
+        # x = r^2 / (2 sigma^2), the argument of the incomplete gamma functions. The
+        # 0-dim smearing terms are combined first, so the distances are scaled only
+        # once.
+        assert self.smearing is not None
+        return dist.square() * (0.5 / self.smearing**2)
 
     @torch.jit.export
     def lr_from_k_sq(self, k_sq: torch.Tensor) -> torch.Tensor:
@@ -105,12 +168,16 @@ class InversePowerLawPotential(Potential):
                 "Cannot compute long-range kernel without specifying `smearing`."
             )
 
-        exponent = self.exponent
-        smearing = self.smearing
+        # reduced precision is only used on CUDA devices
+        return self._lr_from_k_sq(k_sq, self.amp_dtype if k_sq.is_cuda else None)
 
-        peff = (3 - exponent) / 2
-        prefac = torch.pi**1.5 / gamma(exponent / 2) * (2 * smearing**2) ** peff
-        x = 0.5 * smearing**2 * k_sq
+    def _lr_from_k_sq(
+        self, k_sq: torch.Tensor, amp_dtype: Optional[torch.dtype]
+    ) -> torch.Tensor:
+        """:meth:`lr_from_k_sq`, with the kernel evaluated in ``amp_dtype`` if given."""
+        assert self.smearing is not None  # checked in lr_from_k_sq
+        smearing = self.smearing
+        prefac = self._kprefac * (2 * smearing**2) ** self._kpeff
 
         # The k=0 term often needs to be set separately since for exponents p<=3
         # dimension, there is a divergence to +infinity. Setting this value manually
@@ -119,10 +186,24 @@ class InversePowerLawPotential(Potential):
         # Fourier-transformed LR potential does not diverge as k->0, and one
         # could instead assign the correct limit. This is not implemented for now
         # for consistency reasons.
-        masked = torch.where(x == 0, 1.0, x)  # avoid NaNs in backwards, see Coulomb
-        return torch.where(
-            k_sq == 0, 0.0, prefac * gammaincc_over_powerlaw(exponent, masked)
-        )
+        # The function is evaluated on a masked grid to avoid NaNs in backwards (see
+        # Coulomb); the k=0 mask is computed once and reused to zero the result.
+        k_zero = k_sq == 0
+        # cast before scaling, so that no full-precision temporary is created
+        k_sq_amp = k_sq if amp_dtype is None else k_sq.to(amp_dtype)
+        x = 0.5 * smearing**2 * torch.where(k_zero, 1.0, k_sq_amp)
+
+        # The k-space grid can be large, so the kernel is scaled and masked in place
+        # (saving a full-grid temporary) unless autograd needs the unscaled values.
+        fourier = gammaincc_over_powerlaw(self.exponent, x)
+        if fourier.requires_grad or prefac.requires_grad:
+            fourier = prefac * fourier
+        else:
+            fourier.mul_(prefac)
+        fourier.masked_fill_(k_zero, 0.0)
+
+        # no-op, unless the kernel was evaluated in reduced precision
+        return fourier.to(k_sq.dtype)
 
     def self_contribution(self) -> torch.Tensor:
         # self-correction for 1/r^p potential
@@ -130,8 +211,7 @@ class InversePowerLawPotential(Potential):
             raise ValueError(
                 "Cannot compute self contribution without specifying `smearing`."
             )
-        phalf = self.exponent / 2
-        return 1 / gamma(phalf + 1) / (2 * self.smearing**2) ** phalf
+        return self._self_prefac / (2 * self.smearing**2) ** self._peff
 
     def background_correction(self) -> torch.Tensor:
         # "charge neutrality" correction for 1/r^p potential diverges for exponent p = 3
@@ -141,11 +221,11 @@ class InversePowerLawPotential(Potential):
             raise ValueError(
                 "Cannot compute background correction without specifying `smearing`."
             )
-        if self.exponent >= 3:
+        if self._int_exponent >= 3:
             return self.smearing * 0.0
-        prefac = torch.pi**1.5 * (2 * self.smearing**2) ** ((3 - self.exponent) / 2)
-        prefac /= (3 - self.exponent) * gamma(self.exponent / 2)
-        return prefac
+        prefac = self._kprefac / (3 - self._int_exponent)
+        return prefac * (2 * self.smearing**2) ** self._kpeff
 
+    sr_from_dist.__doc__ = Potential.sr_from_dist.__doc__
     self_contribution.__doc__ = Potential.self_contribution.__doc__
     background_correction.__doc__ = Potential.background_correction.__doc__
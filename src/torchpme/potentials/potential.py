@@ -49,15 +49,22 @@ class Potential(torch.nn.Module):
         self.dtype = _get_dtype(dtype)
 
         if smearing is not None:
+            # store a detached copy, so that the buffer is independent of the caller's
+            # tensor and autograd graph
             self.register_buffer(
-                "smearing", torch.tensor(smearing, device=self.device, dtype=self.dtype)
+                "smearing",
+                torch.as_tensor(smearing, device=self.device, dtype=self.dtype)
+                .detach()
+                .clone(),
             )
         else:
             self.smearing = None
         if exclusion_radius is not None:
             self.register_buffer(
                 "exclusion_radius",
-                torch.tensor(exclusion_radius, device=self.device, dtype=self.dtype),
+                torch.as_tensor(exclusion_radius, device=self.device, dtype=self.dtype)
+                .detach()
+                .clone(),
             )
         else:
             self.exclusion_radius = None
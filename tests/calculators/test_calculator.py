@@ -286,3 +286,32 @@ def test_invalid_dtype_neighbor_distances():
             neighbor_indices=NEIGHBOR_INDICES,
             neighbor_distances=NEIGHBOR_DISTANCES.to(dtype=torch.float64),
         )
+
+
+def test_skip_validation():
+    calculator = CalculatorTest()
+    calculator.validate_parameters = False
+
+    # positions are not used in the real-space sum, so the wrong dtype goes unnoticed
+    result = calculator.forward(
+        positions=POSITIONS_1.to(dtype=torch.float64),
+        charges=CHARGES_1,
+        cell=CELL_1,
+        neighbor_indices=NEIGHBOR_INDICES,
+        neighbor_distances=NEIGHBOR_DISTANCES,
+    )
+    assert result.shape == CHARGES_1.shape
+
+
+def test_skip_validation_jit():
+    calculator = torch.jit.script(CalculatorTest())
+    calculator.validate_parameters = False
+
+    result = calculator.forward(
+        positions=POSITIONS_1.to(dtype=torch.float64),
+        charges=CHARGES_1,
+        cell=CELL_1,
+        neighbor_indices=NEIGHBOR_INDICES,
+        neighbor_distances=NEIGHBOR_DISTANCES,
+    )
+    assert result.shape == CHARGES_1.shape
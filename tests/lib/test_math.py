@@ -1,8 +1,9 @@
 import numpy as np
+import pytest
 import scipy.special
 import torch
 
-from torchpme.lib import exp1
+from torchpme.lib import exp1, gammaincc_half_integer
 
 
 def finite_difference_derivative(func, x, h=1e-5):
@@ -29,3 +30,19 @@ def test_torch_exp1_derivative():
         scipy.special.exp1, x.detach().numpy()
     )
     assert np.allclose(torch_exp1_prime.numpy(), finite_diff_result, atol=1e-6)
+
+
+@pytest.mark.parametrize("exponent", [1, 2, 3, 4, 5, 6])
+def test_gammaincc_half_integer_consistency_with_scipy(exponent):
+    x = torch.linspace(1e-6, 50, 10000, dtype=torch.float64)
+    scipy_result = scipy.special.gammaincc(exponent / 2, x.numpy())
+    torch_result = gammaincc_half_integer(exponent, x)
+    assert np.allclose(scipy_result, torch_result.numpy(), rtol=1e-13, atol=0)
+
+    torch_result = gammaincc_half_integer(exponent, x, sqrt_z=torch.sqrt(x))
+    assert np.allclose(scipy_result, torch_result.numpy(), rtol=1e-13, atol=0)
+
+
+def test_gammaincc_half_integer_unsupported_exponent():
+    with pytest.raises(ValueError, match="Unsupported exponent: 7"):
+        gammaincc_half_integer(7, torch.tensor([1.0]))
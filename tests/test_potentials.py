@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 import torch
 from scipy.special import expi
@@ -75,11 +77,11 @@ def test_sr_lr_split(exponent, smearing):
     potential_from_sum = potential_sr_from_dist + potential_lr_from_dist
 
     # Check that the sum of the SR and LR parts is equivalent to the original 1/r^p
-    # potential. Note that the relative errors get particularly large for bigger
-    # interaction exponents. If only p=1 is used, rtol can be reduced to about 3.5 times
+    # potential. Note that the SR and LR parts are evaluated independently (via the
+    # complementary incomplete gamma functions), so the relative error is a few times
     # the machine epsilon.
     atol = 3e-16
-    rtol = 3 * machine_epsilon
+    rtol = 5 * machine_epsilon
     assert_close(potential_from_dist, potential_from_sum, rtol=rtol, atol=atol)
 
 
@@ -606,6 +608,82 @@ def test_potential_device_dtype(potential_class, device, dtype):
     assert potential_lr.dtype == dtype
 
 
+@pytest.mark.parametrize(
+    "potential_class", [CoulombPotential, InversePowerLawPotential]
+)
+def test_smearing_tensor_copy(potential_class):
+    """A tensor ``smearing`` is copied and detached from the caller's graph."""
+    base = torch.tensor(1.0, dtype=dtype, requires_grad=True)
+    smearing = base * base  # non-leaf tensor
+    if potential_class is InversePowerLawPotential:
+        potential = potential_class(exponent=1, smearing=smearing, dtype=dtype)
+    else:
+        potential = potential_class(smearing=smearing, dtype=dtype)
+
+    assert not potential.smearing.requires_grad
+
+    # repeated forward/backward passes do not go through the graph of `smearing`
+    for _ in range(2):
+        positions = dists.clone().requires_grad_()
+        potential.lr_from_dist(positions).sum().backward()
+        assert positions.grad is not None
+
+    copy.deepcopy(potential)
+
+    with torch.no_grad():
+        smearing.fill_(3.0)
+    assert potential.smearing.item() == 1.0
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+@pytest.mark.parametrize("exponent", [1, 2, 3, 4, 5, 6])
+def test_inverserp_amp_dtype(exponent, device):
+    if device == "cuda" and not torch.cuda.is_available():
+        pytest.skip("CUDA is not available")
+
+    ipl = InversePowerLawPotential(
+        exponent=exponent, smearing=1.0, dtype=dtype, device=device
+    )
+    ipl_amp = InversePowerLawPotential(
+        exponent=exponent,
+        smearing=1.0,
+        dtype=dtype,
+        device=device,
+        amp_dtype=torch.bfloat16,
+    )
+
+    k_sq = ks_sq.to(device=device)
+    reference = ipl.lr_from_k_sq(k_sq)
+    fourier = ipl_amp.lr_from_k_sq(k_sq)
+
+    assert fourier.dtype == dtype
+    if device == "cpu":
+        # the reduced precision is only used on CUDA devices
+        assert_close(fourier, reference, rtol=0, atol=0)
+    else:
+        atol = 1e-2 * reference.abs().max().item()
+        assert_close(fourier, reference, rtol=0, atol=atol)
+
+
+@pytest.mark.parametrize("exponent", [1, 2, 3, 4, 5, 6])
+def test_inverserp_amp_dtype_kernel(exponent):
+    """The reduced-precision kernel is within ~1% of the full-precision one."""
+    ipl = InversePowerLawPotential(exponent=exponent, smearing=1.0, dtype=dtype)
+
+    reference = ipl.lr_from_k_sq(ks_sq)
+    fourier = ipl._lr_from_k_sq(ks_sq, torch.bfloat16)
+
+    assert fourier.dtype == dtype
+    atol = 1e-2 * reference.abs().max().item()
+    assert_close(fourier, reference, rtol=0, atol=atol)
+
+
+def test_inverserp_amp_dtype_error():
+    match = r"`amp_dtype` must be a floating point type, got torch.int32"
+    with pytest.raises(TypeError, match=match):
+        InversePowerLawPotential(exponent=1, smearing=1.0, amp_dtype=torch.int32)
+
+
 @pytest.mark.parametrize("exponent", [4, 5, 6])
 @pytest.mark.parametrize("smearing", smearinges)
 def test_inverserp_vs_spline(exponent, smearing):